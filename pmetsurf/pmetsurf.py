@@ -1,8 +1,27 @@
 # coding: utf8
 
+import collections
 import numpy as np
 from scipy.interpolate import RectBivariateSpline, LSQUnivariateSpline
 
+try:
+    from numba import njit, prange
+    has_numba = True
+except ImportError:
+    has_numba = False
+
+try:
+    import xxhash
+    has_xxhash = True
+except ImportError:
+    has_xxhash = False
+
+try:
+    import cupy
+    has_cupy = True
+except ImportError:
+    has_cupy = False
+
 
 def vectordot(a, b):
     """Perform a dot product on vectors of coordinates
@@ -13,28 +32,188 @@ def vectordot(a, b):
     :param b: A similarly-shaped NxM matrix
     :returns: a vector of length N giving the dot product of each a.b pair
     """
-    return np.sum(a * b, 1)
+    # einsum fuses the multiply and the reduction into one pass,
+    # avoiding the NxM temporary that np.sum(a * b, 1) allocates
+    return np.einsum("ij,ij->i", a, b)
+
+
+def vectordot_soa(a, b):
+    """Perform a dot product on vectors given as component tuples
+
+    Like :func:`vectordot` but for the structure-of-arrays layout used
+    internally: each operand is a tuple of contiguous 1-D component
+    arrays, which keeps the arithmetic unit-strided.
+
+    :param a: a tuple of component vectors, each of length N
+    :param b: a similarly-shaped tuple
+    :returns: a vector of length N giving the dot product of each a.b pair
+    """
+    a0, a1, a2 = a
+    b0, b1, b2 = b
+    return a0 * b0 + a1 * b1 + a2 * b2
+
+
+#: Maximum number of entries kept in a surface's evaluation cache
+CACHE_MAXSIZE = 64
+
+#: Arrays larger than this are cache-keyed by identity instead of content
+HASH_MAX_BYTES = 1024 * 1024
+
+#: Batches smaller than this are not worth sorting by spline cell
+SORT_MIN_SIZE = 1024
+
+
+def _array_token(a):
+    """A cache token identifying an array's contents
+
+    Content-identical arrays get equal tokens, so a caller that copies
+    or recomputes the same u/v grid still hits the cache.  Hashing is
+    capped at HASH_MAX_BYTES - larger arrays, and anything that is not
+    an ndarray, fall back to identity.
+
+    :param a: the u or v query argument
+    :returns: a hashable token for the evaluation cache key
+    """
+    if isinstance(a, np.ndarray) and a.nbytes < HASH_MAX_BYTES:
+        data = np.ascontiguousarray(a)
+        if has_xxhash:
+            return xxhash.xxh3_64(data).intdigest(), a.shape, a.dtype.str
+        return hash(data.tobytes()), a.shape, a.dtype.str
+    if np.isscalar(a):
+        # scalars are their own token - identity would tie the cache
+        # entry to a particular float object rather than its value
+        return a
+    return id(a), getattr(a, "shape", None)
 
 
 def memoize(function):
-    last_u = {}
-    last_v = {}
-    last_result = {}
+    """Cache a method's result in the instance's evaluation cache
+
+    The result is stored in ``self._cache``, a bounded LRU keyed by the
+    method name and a content token for each of the u and v arrays, so
+    repeated or alternating queries over the same grid hit the cache
+    and the cache is freed along with the instance.
+    """
+    name = function.__name__
 
     def wrapper(self, u, v):
-        selfid = id(self)
-        uid = id(u)
-        vid = id(v)
-        if selfid in last_u and last_u[selfid] == uid and last_v[selfid] == vid:
-            return last_result[selfid]
-        last_result[selfid] = function(self, u, v)
-        last_u[selfid] = uid
-        last_v[selfid] = vid
-        return last_result[selfid]
+        key = (name, _array_token(u), _array_token(v))
+        cache = self._cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key][2]
+        result = function(self, u, v)
+        # keep u and v alive alongside the result: identity-based
+        # tokens are only valid while the keyed objects exist, and a
+        # recycled id would otherwise serve a stale hit
+        cache[key] = (u, v, result)
+        if len(cache) > CACHE_MAXSIZE:
+            cache.popitem(last=False)
+        return result
 
     return wrapper
 
 
+def _find_interval(t, k, x, xp=np):
+    """Find the knot interval containing each point
+
+    :param t: the knot vector
+    :param k: the degree of the spline
+    :param x: the points to locate, a 1-D array
+    :param xp: the array module to compute with - numpy, or cupy for
+              arrays on the GPU
+    :returns: for each x, the index i such that t[i] <= x < t[i+1],
+              clipped to the interior of the knot vector so that points
+              on the right boundary use the last polynomial piece
+    """
+    n = len(t) - k - 1
+    i = xp.searchsorted(t, x, side="right") - 1
+    return xp.clip(i, k, n - 1)
+
+
+def _bspline_basis(t, k, i, x, xp=np):
+    """The k+1 non-zero B-spline basis functions at each point
+
+    Vectorized Cox-de Boor recurrence (algorithm A2.2 of the NURBS book).
+
+    :param t: the knot vector
+    :param k: the degree of the spline
+    :param i: the knot interval index for each x, from :func:`_find_interval`
+    :param x: the points at which to evaluate, a 1-D array
+    :param xp: the array module to compute with - numpy, or cupy for
+              arrays on the GPU
+    :returns: a (len(x), k+1) array whose row p holds
+              B[i[p]-k](x[p]) ... B[i[p]](x[p])
+    """
+    b = xp.zeros((len(x), k + 1), dtype=x.dtype)
+    b[:, 0] = 1.0
+    left = xp.empty((len(x), k + 1), dtype=x.dtype)
+    right = xp.empty((len(x), k + 1), dtype=x.dtype)
+    for j in range(1, k + 1):
+        left[:, j] = x - t[i + 1 - j]
+        right[:, j] = t[i + j] - x
+        saved = 0.0
+        for r in range(j):
+            temp = b[:, r] / (right[:, r + 1] + left[:, j - r])
+            b[:, r] = saved + right[:, r + 1] * temp
+            saved = left[:, j - r] * temp
+        b[:, j] = saved
+    return b
+
+
+def _uniform_spacing(t, k):
+    """The interior knot spacing, if the knots are uniformly spaced
+
+    FITPACK gives the first and last cells double width even for
+    uniformly gridded data, so the uniform run is t[k+1] .. t[n-1];
+    points in the two boundary cells are handled by clipping the
+    computed index.
+
+    :param t: the knot vector
+    :param k: the degree of the spline
+    :returns: the spacing between interior knots, or None if they are
+              not uniformly spaced
+    """
+    dt = np.diff(t[k + 1:len(t) - k - 1])
+    # compare spacings relatively - the default atol would pass any
+    # grid whose absolute scale is below ~1e-8, however irregular
+    if len(dt) > 0 and np.allclose(dt, dt[0], rtol=1e-10, atol=0.0):
+        return dt[0]
+    return None
+
+
+def _derive_spline(t, c, k):
+    """Differentiate a B-spline once along the first axis of its coefficients
+
+    :param t: the knot vector
+    :param c: the coefficient grid, with the differentiated axis first
+    :param k: the degree of the spline
+    :returns: the (knots, coefficients, degree) of the derivative spline
+    """
+    denom = t[k + 1:-1] - t[1:-k - 1]
+    dc = k * (c[1:] - c[:-1]) / denom.reshape((-1,) + (1,) * (c.ndim - 1))
+    return t[1:-1], dc, k - 1
+
+
+if has_numba:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _contract_njit(c, kx, ky, iu, bu, iv, bv, out):
+        """Per-point tensor contraction of basis values with a coefficient grid
+
+        The interval indices and Cox-de Boor basis values are computed
+        once per batch by ParametricSurface._locate and shared across
+        all grids; this kernel only performs the (kx+1)x(ky+1) tile
+        contraction, keeping the tile in registers.
+        """
+        for p in prange(len(iu)):
+            acc = 0.0
+            for a in range(kx + 1):
+                ba = bu[p, a]
+                for b in range(ky + 1):
+                    acc += ba * bv[p, b] * c[iu[p] - kx + a, iv[p] - ky + b]
+            out[p] = acc
+
+
 class ParametricSurface:
     """A 3D surface in x, y, z parameterized by u and v
 
@@ -44,7 +223,7 @@ class ParametricSurface:
     https://en.wikipedia.org/wiki/Parametric_surface
     """
 
-    def __init__(self, u, v, x, y, z):
+    def __init__(self, u, v, x, y, z, dtype=np.float64):
         """
         Initialize with three matrices in x, y and z
 
@@ -56,26 +235,369 @@ class ParametricSurface:
                   coordinate at each u, v
         :param z: a matrix of dimension, (len(u), len(v)) giving the Z
                   coordinate at each u, v
+        :param dtype: the floating-point type used to store the spline
+                  coefficients and evaluate queries. np.float32 halves
+                  the memory traffic of evaluation at the cost of ~7
+                  significant digits, which is usually well below the
+                  error of the fit itself.
         """
+        self._dtype = np.dtype(dtype)
         self.splx = RectBivariateSpline(u, v, x)
         self.sply = RectBivariateSpline(u, v, y)
         self.splz = RectBivariateSpline(u, v, z)
+        self._cache = collections.OrderedDict()
+        self._make_grids()
+
+    @classmethod
+    def from_tck(cls, tck_x, tck_y, tck_z, dtype=np.float64):
+        """Construct a surface from previously fitted spline knots/coefficients
+
+        Fitting the three splines is the expensive part of construction;
+        a caller that already has the (tx, ty, c) tuples - e.g. from
+        :meth:`save_tck` or from fitting a previous surface over the
+        same grid - can skip it entirely.
+
+        :param tck_x: the (tx, ty, c) tuple of the bicubic spline in X,
+                  as produced by RectBivariateSpline.tck
+        :param tck_y: a similar tuple for the spline in Y
+        :param tck_z: a similar tuple for the spline in Z
+        :param dtype: the floating-point type used for evaluation, as
+                  in the constructor
+        :returns: a ParametricSurface over the given splines
+        """
+        self = cls.__new__(cls)
+        self._dtype = np.dtype(dtype)
+        for name, (tx, ty, c) in (("splx", tck_x),
+                                  ("sply", tck_y),
+                                  ("splz", tck_z)):
+            spl = RectBivariateSpline.__new__(RectBivariateSpline)
+            spl.tck = (np.asarray(tx, dtype=np.float64),
+                       np.asarray(ty, dtype=np.float64),
+                       np.ravel(np.asarray(c, dtype=np.float64)))
+            spl.degrees = (3, 3)
+            setattr(self, name, spl)
+        self._cache = collections.OrderedDict()
+        self._make_grids()
+        return self
+
+    def save_tck(self, path):
+        """Save the fitted spline knots and coefficients to an .npz file
+
+        The saved file can be reloaded with :meth:`load_tck` to rebuild
+        the surface without refitting.
+
+        :param path: the path of the file to write
+        """
+        arrays = {}
+        for name, spl in (("x", self.splx), ("y", self.sply),
+                          ("z", self.splz)):
+            tx, ty, c = spl.tck
+            arrays["tx_" + name] = tx
+            arrays["ty_" + name] = ty
+            arrays["c_" + name] = c
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load_tck(cls, path, dtype=np.float64):
+        """Rebuild a surface saved with :meth:`save_tck`
+
+        :param path: the path of the .npz file to read
+        :param dtype: the floating-point type used for evaluation, as
+                  in the constructor
+        :returns: a ParametricSurface over the saved splines
+        """
+        with np.load(path) as fd:
+            return cls.from_tck(
+                *[(fd["tx_" + name], fd["ty_" + name], fd["c_" + name])
+                  for name in "xyz"],
+                dtype=dtype)
+
+    def _make_grids(self):
+        """Precompute the spline coefficient grids for every derivative order
+
+        The knots and coefficients never change after fitting, so the
+        derivative splines of every (dx, dy) order in _ORDERS can be
+        derived once here.  _eval_all then evaluates them directly in
+        NumPy instead of going through RectBivariateSpline.ev per call.
+        """
+        self._grids = {}
+        for spl in (self.splz, self.sply, self.splx):
+            kx, ky = spl.degrees
+            tx, ty, c = spl.tck
+            c = np.asarray(c).reshape(len(tx) - kx - 1, len(ty) - ky - 1)
+            by_dx = {0: (tx, c, kx)}
+            for dx in (1, 2):
+                by_dx[dx] = _derive_spline(*by_dx[dx - 1])
+            for dx, dy in self._ORDERS:
+                txd, cd, kxd = by_dx[dx]
+                tyd, cd, kyd = ty, cd, ky
+                for _ in range(dy):
+                    tyd, cdT, kyd = _derive_spline(tyd, cd.T, kyd)
+                    cd = cdT.T
+                # differentiation is done in float64 above; only the
+                # stored grids are narrowed to the requested dtype
+                self._grids.setdefault((dx, dy), []).append(
+                    (txd.astype(self._dtype), tyd.astype(self._dtype),
+                     np.ascontiguousarray(cd, dtype=self._dtype), kxd, kyd))
+        self._gpu_grids = None
+        # uniform knots (the common linspace case) allow locating cells
+        # with a multiply and floor instead of a binary search
+        tx, ty, _, kx, ky = self._grids[0, 0][0]
+        du_knot = _uniform_spacing(tx, kx)
+        dv_knot = _uniform_spacing(ty, ky)
+        self._inv_du = None if du_knot is None else 1.0 / du_knot
+        self._inv_dv = None if dv_knot is None else 1.0 / dv_knot
+
+    @memoize
+    def _locate(self, u, v):
+        """Locate each query point and evaluate its basis functions
+
+        The three coordinate splines share a single knot vector per
+        axis, so the interval search and the Cox-de Boor basis values
+        for each derivative degree can be computed once per (u, v)
+        batch here and reused by every grid evaluation, instead of
+        once per spline per derivative order.
+
+        :param u: a 1-D array of the u being queried
+        :param v: a 1-D array of the v being queried
+        :returns: two dictionaries, one per axis, mapping derivative
+                  order to (interval indices, basis values)
+        """
+        tx, ty, _, kx, ky = self._grids[0, 0][0]
+        # FITPACK clamps queries to the knot range rather than
+        # extrapolating; do the same for compatibility
+        u = np.clip(u, tx[kx], tx[-kx - 1])
+        v = np.clip(v, ty[ky], ty[-ky - 1])
+        if self._inv_du is None:
+            iu = _find_interval(tx, kx, u)
+        else:
+            iu = kx + 1 + np.floor(
+                (u - tx[kx + 1]) * self._inv_du).astype(np.intp)
+            np.clip(iu, kx, len(tx) - kx - 2, out=iu)
+        if self._inv_dv is None:
+            iv = _find_interval(ty, ky, v)
+        else:
+            iv = ky + 1 + np.floor(
+                (v - ty[ky + 1]) * self._inv_dv).astype(np.intp)
+            np.clip(iv, ky, len(ty) - ky - 2, out=iv)
+        locu = {}
+        locv = {}
+        for d in range(3):
+            # differentiating drops a knot at each end, shifting the
+            # interval index of the same point down by d
+            txd = self._grids[d, 0][0][0]
+            tyd = self._grids[0, d][0][1]
+            locu[d] = (iu - d, _bspline_basis(txd, kx - d, iu - d, u))
+            locv[d] = (iv - d, _bspline_basis(tyd, ky - d, iv - d, v))
+        return locu, locv
+
+    def _eval_grid(self, grid, loc_u, loc_v):
+        """Evaluate one precomputed spline grid at located query points
+
+        :param grid: a (tx, ty, c, kx, ky) tuple from _make_grids
+        :param loc_u: the (interval indices, basis values) for the u axis
+        :param loc_v: the (interval indices, basis values) for the v axis
+        :returns: a vector of the spline values at each query point
+        """
+        c, kx, ky = grid[2:]
+        iu, bu = loc_u
+        iv, bv = loc_v
+        if has_numba:
+            out = np.empty(len(iu), dtype=c.dtype)
+            _contract_njit(c, kx, ky, iu, bu, iv, bv, out)
+            return out
+        idxu = iu[:, None] - kx + np.arange(kx + 1)
+        idxv = iv[:, None] - ky + np.arange(ky + 1)
+        tiles = c[idxu[:, :, None], idxv[:, None, :]]
+        return np.einsum("na,nab,nb->n", bu, tiles, bv)
+
+    def _grids_cupy(self):
+        """The coefficient grids, uploaded to the GPU on first use
+
+        The grids are small and immutable, so they are copied to the
+        device once and stay resident for the life of the surface.
+        """
+        if not has_cupy:
+            raise ImportError("cupy is required for the *_cupy methods")
+        if self._gpu_grids is None:
+            self._gpu_grids = {
+                order: [(cupy.asarray(tx), cupy.asarray(ty),
+                         cupy.asarray(c), kx, ky)
+                        for tx, ty, c, kx, ky in grids]
+                for order, grids in self._grids.items()}
+        return self._gpu_grids
+
+    def _eval_all_cupy(self, u, v):
+        """Evaluate the surface and all of its derivatives on the GPU
+
+        The CuPy counterpart of _locate plus _eval_grid: one transfer
+        of the query batch to the device, one shared interval search
+        and basis evaluation, and one fused contraction per grid.  Only
+        worthwhile for large batches, where the per-point parallelism
+        amortizes the host-to-device copy of u and v.  Requires cupy.
+
+        :param u: a vector of the u at which to evaluate
+        :param v: a vector of the v at which to evaluate
+        :returns: a dictionary mapping (dx, dy) to a tuple of the
+                  z, y and x component vectors, as device arrays
+        """
+        grids = self._grids_cupy()
+        u = cupy.ravel(cupy.asarray(u, dtype=self._dtype))
+        v = cupy.ravel(cupy.asarray(v, dtype=self._dtype))
+        tx, ty, _, kx, ky = grids[0, 0][0]
+        u = cupy.clip(u, tx[kx], tx[-kx - 1])
+        v = cupy.clip(v, ty[ky], ty[-ky - 1])
+        iu = _find_interval(tx, kx, u, xp=cupy)
+        iv = _find_interval(ty, ky, v, xp=cupy)
+        locu = {}
+        locv = {}
+        for d in range(3):
+            txd = grids[d, 0][0][0]
+            tyd = grids[0, d][0][1]
+            locu[d] = (iu - d, _bspline_basis(txd, kx - d, iu - d, u,
+                                              xp=cupy))
+            locv[d] = (iv - d, _bspline_basis(tyd, ky - d, iv - d, v,
+                                              xp=cupy))
+        result = {}
+        for dx, dy in self._ORDERS:
+            iud, bu = locu[dx]
+            ivd, bv = locv[dy]
+            components = []
+            for _, _, c, kxd, kyd in grids[dx, dy]:
+                idxu = iud[:, None] - kxd + cupy.arange(kxd + 1)
+                idxv = ivd[:, None] - kyd + cupy.arange(kyd + 1)
+                tiles = c[idxu[:, :, None], idxv[:, None, :]]
+                components.append(
+                    cupy.einsum("na,nab,nb->n", bu, tiles, bv))
+            result[dx, dy] = tuple(components)
+        return result
+
+    def _stack_cupy(self, u, v, order):
+        if not has_cupy:
+            raise ImportError("cupy is required for the *_cupy methods")
+        return cupy.stack(self._eval_all_cupy(u, v)[order], axis=1)
+
+    def coordinates_cupy(self, u, v):
+        """The surface coordinates at u, v, computed on the GPU
+
+        :param u: a vector of the u at which to evaluate
+        :param v: a vector of the v at which to evaluate
+        :returns: an Nx3 device array of the z, y and x coordinates
+        """
+        return self._stack_cupy(u, v, (0, 0))
+
+    def du_cupy(self, u, v):
+        """The derivative with respect to U, computed on the GPU"""
+        return self._stack_cupy(u, v, (1, 0))
+
+    def dv_cupy(self, u, v):
+        """The derivative with respect to V, computed on the GPU"""
+        return self._stack_cupy(u, v, (0, 1))
+
+    def duu_cupy(self, u, v):
+        """The second derivative with respect to U, computed on the GPU"""
+        return self._stack_cupy(u, v, (2, 0))
+
+    def dvv_cupy(self, u, v):
+        """The second derivative with respect to V, computed on the GPU"""
+        return self._stack_cupy(u, v, (0, 2))
+
+    def duv_cupy(self, u, v):
+        """The u/v cross derivative dudv, computed on the GPU"""
+        return self._stack_cupy(u, v, (1, 1))
 
     def __getitem__(self, item):
         """Get the surface coordinate at u, v
 
+        Accepts either vectors of u and v or a single scalar pair; for
+        scalars a single (z, y, x) vector is returned.  Batching many
+        points into one call is much faster than looping over scalars,
+        since the whole batch shares one spline evaluation.
         """
         u, v = item
-        return self.__getitem(u, v)
+        result = self.__getitem(u, v)
+        if np.isscalar(u) and np.isscalar(v):
+            return result[0]
+        return result
+
+    #: The (dx, dy) derivative orders needed by the curvature pipeline
+    _ORDERS = ((0, 0), (1, 0), (0, 1), (2, 0), (0, 2), (1, 1))
 
     @memoize
+    def _eval_all(self, u, v):
+        """Evaluate the surface and all of its derivatives at u, v
+
+        Computes every (dx, dy) derivative order needed by the curvature
+        pipeline in one pass, so that a curvature query pays the spline
+        dispatch cost once per order instead of once per method call.
+
+        :param u: a vector of the u at which to evaluate
+        :param v: a vector of the v at which to evaluate
+        :returns: a dictionary mapping (dx, dy) to a tuple of the
+                  z, y and x component vectors of that derivative
+        """
+        u = np.ravel(np.asanyarray(u, dtype=self._dtype))
+        v = np.ravel(np.asanyarray(v, dtype=self._dtype))
+        if len(u) != len(v):
+            # match FITPACK, which broadcasts a size-1 operand against
+            # the other and raises on incompatible lengths
+            u, v = [np.ascontiguousarray(_)
+                    for _ in np.broadcast_arrays(u, v)]
+        perm = self._cell_order(u, v)
+        if perm is None:
+            inverse = slice(None)
+        else:
+            u = u[perm]
+            v = v[perm]
+            inverse = np.empty_like(perm)
+            inverse[perm] = np.arange(len(perm))
+        locu, locv = self._locate(u, v)
+        return {
+            (dx, dy): tuple(
+                self._eval_grid(grid, locu[dx], locv[dy])[inverse]
+                for grid in self._grids[dx, dy])
+            for dx, dy in self._ORDERS}
+
+    def _cell_order(self, u, v):
+        """The permutation that groups a query batch by spline cell
+
+        Evaluating points in cell order keeps each 4x4 coefficient tile
+        hot in cache while all of its points are processed.
+
+        :param u: a 1-D array of the u being queried
+        :param v: a 1-D array of the v being queried
+        :returns: an index permutation to apply before evaluation, or
+                  None when sorting is not worthwhile (small batches or
+                  queries already in cell order)
+        """
+        if len(u) < SORT_MIN_SIZE:
+            return None
+        tx, ty = self._grids[0, 0][0][:2]
+        iu = np.searchsorted(tx, u)
+        iv = np.searchsorted(ty, v)
+        perm = np.lexsort((iv, iu))
+        if np.array_equal(perm, np.arange(len(perm))):
+            return None
+        return perm
+
     def __getitem(self, u, v):
-        u = np.asanyarray(u)
-        v = np.asanyarray(v)
-        return np.column_stack(
-            [_.ev(u, v) for _ in (self.splz, self.sply, self.splx)])
+        return np.stack(self._eval_all(u, v)[0, 0], axis=1)
+
+    def _du_soa(self, u, v):
+        return self._eval_all(u, v)[1, 0]
+
+    def _dv_soa(self, u, v):
+        return self._eval_all(u, v)[0, 1]
+
+    def _duu_soa(self, u, v):
+        return self._eval_all(u, v)[2, 0]
+
+    def _dvv_soa(self, u, v):
+        return self._eval_all(u, v)[0, 2]
+
+    def _duv_soa(self, u, v):
+        return self._eval_all(u, v)[1, 1]
 
-    @memoize
     def du(self, u, v):
         """The derivative with respect to U
 
@@ -84,10 +606,8 @@ class ParametricSurface:
         :param u: a vector of the u at which to evaluate
         :param v: a vector of the v at which to evaluate
         """
-        return np.column_stack(
-            [_.ev(u, v, dx=1) for _ in (self.splz, self.sply, self.splx)])
+        return np.stack(self._du_soa(u, v), axis=1)
 
-    @memoize
     def dv(self, u, v):
         """The derivative with respect to V
 
@@ -96,10 +616,8 @@ class ParametricSurface:
         :param u: a vector of the u at which to evaluate
         :param v: a vector of the v at which to evaluate
         """
-        return np.column_stack(
-            [_.ev(u, v, dy=1) for _ in (self.splz, self.sply, self.splx)])
+        return np.stack(self._dv_soa(u, v), axis=1)
 
-    @memoize
     def duu(self, u, v):
         """The second derivative with respect to U
 
@@ -108,10 +626,8 @@ class ParametricSurface:
         :param u: a vector of the u at which to evaluate
         :param v: a vector of the v at which to evaluate
         """
-        return np.column_stack(
-            [_.ev(u, v, dx=2) for _ in (self.splz, self.sply, self.splx)])
+        return np.stack(self._duu_soa(u, v), axis=1)
 
-    @memoize
     def dvv(self, u, v):
         """The second derivative with respect to V
 
@@ -120,18 +636,15 @@ class ParametricSurface:
         :param u: a vector of the u at which to evaluate
         :param v: a vector of the v at which to evaluate
         """
-        return np.column_stack(
-            [_.ev(u, v, dy=2) for _ in (self.splz, self.sply, self.splx)])
+        return np.stack(self._dvv_soa(u, v), axis=1)
 
-    @memoize
     def duv(self, u, v):
         """The u/v cross derivative dudv
 
         :param u: a vector of the u at which to evaluate
         :param v: a vector of the v at which to evaluate
         """
-        return np.column_stack(
-            [_.ev(u, v, dx=1, dy=1) for _ in (self.splz, self.sply, self.splx)])
+        return np.stack(self._duv_soa(u, v), axis=1)
 
     @memoize
     def E(self, u, v):
@@ -142,7 +655,7 @@ class ParametricSurface:
         :param u: a vector of the u at which to evaluate
         :param v: a vector of the v at which to evaluate
         """
-        return vectordot(self.du(u, v), self.du(u, v))
+        return vectordot_soa(self._du_soa(u, v), self._du_soa(u, v))
 
     @memoize
     def F(self, u, v):
@@ -153,7 +666,7 @@ class ParametricSurface:
         :param u: a vector of the u at which to evaluate
         :param v: a vector of the v at which to evaluate
         """
-        return vectordot(self.du(u, v), self.dv(u, v))
+        return vectordot_soa(self._du_soa(u, v), self._dv_soa(u, v))
 
     @memoize
     def G(self, u, v):
@@ -164,9 +677,26 @@ class ParametricSurface:
         :param u: a vector of the u at which to evaluate
         :param v: a vector of the v at which to evaluate
         """
-        return vectordot(self.dv(u, v), self.dv(u, v))
+        return vectordot_soa(self._dv_soa(u, v), self._dv_soa(u, v))
 
     @memoize
+    def _normal_soa(self, u, v):
+        """The unit surface normal as a (z, y, x) component tuple
+
+        :param u: a vector of the u at which to evaluate
+        :param v: a vector of the v at which to evaluate
+        :returns: a tuple of the z, y and x component vectors
+        """
+        a0, a1, a2 = self._du_soa(u, v)
+        b0, b1, b2 = self._dv_soa(u, v)
+        # Expand the cross product by component - np.cross spends most
+        # of its time in generic axis handling for Nx3 operands
+        n0 = a1 * b2 - a2 * b1
+        n1 = a2 * b0 - a0 * b2
+        n2 = a0 * b1 - a1 * b0
+        scale = 1.0 / np.sqrt(n0 * n0 + n1 * n1 + n2 * n2)
+        return n0 * scale, n1 * scale, n2 * scale
+
     def normal(self, u, v):
         """The vector normal to the surface
 
@@ -174,9 +704,7 @@ class ParametricSurface:
         :param v: a vector of the v at which to evaluate
         :returns: vectors normal to the surface at each u, v
         """
-        result = np.cross(self.du(u, v), self.dv(u, v))
-        result = result / np.sqrt(vectordot(result, result))[:, None]
-        return result
+        return np.stack(self._normal_soa(u, v), axis=1)
 
     @memoize
     def L(self, u, v):
@@ -186,7 +714,7 @@ class ParametricSurface:
         :param u: a vector of the u at which to evaluate
         :param v: a vector of the v at which to evaluate
         """
-        return vectordot(self.duu(u, v), self.normal(u, v))
+        return vectordot_soa(self._duu_soa(u, v), self._normal_soa(u, v))
 
     @memoize
     def M(self, u, v):
@@ -196,7 +724,7 @@ class ParametricSurface:
         :param u: a vector of the u at which to evaluate
         :param v: a vector of the v at which to evaluate
         """
-        return vectordot(self.duv(u, v), self.normal(u, v))
+        return vectordot_soa(self._duv_soa(u, v), self._normal_soa(u, v))
 
     @memoize
     def N(self, u, v):
@@ -206,9 +734,78 @@ class ParametricSurface:
         :param u: a vector of the u at which to evaluate
         :param v: a vector of the v at which to evaluate
         """
-        return vectordot(self.dvv(u, v), self.normal(u, v))
+        return vectordot_soa(self._dvv_soa(u, v), self._normal_soa(u, v))
 
     @memoize
+    def _curvatures(self, u, v):
+        """The Gaussian, mean and principal curvatures at u, v
+
+        K, H, kmax and kmin share most of their arithmetic - in
+        particular the determinant EG - F**2 and the discriminant
+        H**2 - K - so compute all four together in one pass over the
+        fundamental-form coefficients.  L, M and N are taken against
+        the *unnormalized* cross product du x dv: its squared length is
+        exactly EG - F**2, so the normalization that normal() performs
+        cancels against the determinant and never needs computing -
+        K = (L'N' - M'**2) / det**2 and
+        H = (EN' - 2FM' + GL') / (2 det**(3/2)) with primed,
+        unnormalized coefficients.
+
+        :param u: a vector of the u at which to evaluate
+        :param v: a vector of the v at which to evaluate
+        :returns: a tuple of (K, H, kmax, kmin) vectors
+        """
+        a0, a1, a2 = self._du_soa(u, v)
+        b0, b1, b2 = self._dv_soa(u, v)
+        e = self.E(u, v)
+        f = self.F(u, v)
+        g = self.G(u, v)
+        cross = (a1 * b2 - a2 * b1, a2 * b0 - a0 * b2, a0 * b1 - a1 * b0)
+        ll = vectordot_soa(self._duu_soa(u, v), cross)
+        m = vectordot_soa(self._duv_soa(u, v), cross)
+        n = vectordot_soa(self._dvv_soa(u, v), cross)
+        # Chain the ufuncs through four preallocated buffers via out=
+        # so the rest of the pipeline allocates nothing further - e, f
+        # and g are cached and must not be written to
+        tmp = np.empty_like(e)
+        inv_det = np.empty_like(e)
+        gaussian = np.empty_like(e)
+        mean = np.empty_like(e)
+        # inv_det = 1 / (EG - F**2)
+        np.multiply(e, g, out=inv_det)
+        np.multiply(f, f, out=tmp)
+        np.subtract(inv_det, tmp, out=inv_det)
+        np.divide(1.0, inv_det, out=inv_det)
+        # K = (L'N' - M'**2) * inv_det**2
+        np.multiply(ll, n, out=gaussian)
+        np.multiply(m, m, out=tmp)
+        np.subtract(gaussian, tmp, out=gaussian)
+        np.multiply(gaussian, inv_det, out=gaussian)
+        np.multiply(gaussian, inv_det, out=gaussian)
+        # H = (EN' - 2FM' + GL') * inv_det**(3/2) / 2
+        np.multiply(e, n, out=mean)
+        np.multiply(f, m, out=tmp)
+        tmp *= 2.0
+        np.subtract(mean, tmp, out=mean)
+        np.multiply(g, ll, out=tmp)
+        np.add(mean, tmp, out=mean)
+        np.multiply(mean, inv_det, out=mean)
+        np.sqrt(inv_det, out=tmp)
+        np.multiply(mean, tmp, out=mean)
+        mean *= 0.5
+        # At umbilic points H**2 - K is zero in exact arithmetic but
+        # can come out slightly negative in floating point, which would
+        # turn both principal curvatures into NaN - clamp it
+        np.multiply(mean, mean, out=tmp)
+        np.subtract(tmp, gaussian, out=tmp)
+        np.maximum(tmp, 0.0, out=tmp)
+        np.sqrt(tmp, out=tmp)
+        # inv_det and tmp are dead after this point; reuse them for
+        # the principal curvatures
+        k_max = np.add(mean, tmp, out=inv_det)
+        k_min = np.subtract(mean, tmp, out=tmp)
+        return gaussian, mean, k_max, k_min
+
     def K(self, u, v):
         """The Gaussian curvature at u, v
 
@@ -218,10 +815,8 @@ class ParametricSurface:
         :param v: a vector of the v at which to evaluate
         :returns: the Gaussian curvature at each u, v
         """
-        return (self.L(u, v) * self.N(u, v) - np.square(self.M(u, v))) / \
-               (self.E(u, v) * self.G(u, v) - np.square(self.F(u, v)))
+        return self._curvatures(u, v)[0]
 
-    @memoize
     def H(self, u, v):
         """The mean curvature at u, v
 
@@ -231,12 +826,8 @@ class ParametricSurface:
         :param v: a vector of the v at which to evaluate
         :returns: the mean curvature at each u, v
         """
-        return (self.E(u, v) * self.N(u, v)
-                - 2 * self.F(u, v) * self.M(u, v)
-                + self.G(u, v) * self.L(u, v)) / \
-               (2 * (self.E(u, v) * self.G(u, v) - np.square(self.F(u, v))))
+        return self._curvatures(u, v)[1]
 
-    @memoize
     def kmax(self, u, v):
         """The maximum curvature at u, v
 
@@ -246,9 +837,8 @@ class ParametricSurface:
         :param v: a vector of the v at which to evaluate
         :returns: the maximum curvature at each u, v
         """
-        return self.H(u, v) + np.sqrt(np.square(self.H(u, v)) - self.K(u, v))
+        return self._curvatures(u, v)[2]
 
-    @memoize
     def kmin(self, u, v):
         """The minimum curvature at u, v
 
@@ -258,7 +848,7 @@ class ParametricSurface:
         :param v: a vector of the v at which to evaluate
         :returns: the minimum curvature at each u, v
         """
-        return self.H(u, v) - np.sqrt(np.square(self.H(u, v)) - self.K(u, v))
+        return self._curvatures(u, v)[3]
 
 
 class ParametricCurve:
@@ -299,7 +889,7 @@ class ParametricCurve:
         t1 = np.atleast_1d(t)
         dx = self.dx(t1)
         dy = self.dy(t1)
-        dt = np.sqrt(np.square(dx) + np.square(dy))
+        dt = np.sqrt(dx * dx + dy * dy)
         result = np.column_stack((dx / dt, -dy / dt))
         if np.isscalar(t):
             return result[0]